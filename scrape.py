@@ -1,12 +1,20 @@
 import csv
+import hashlib
+import io
+import json
 import re
 import requests
-import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from email.utils import format_datetime
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, timezone
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from datetime import date, datetime, timezone
+from lxml import etree
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from typing import Callable, List, Dict, Optional, Tuple
+from urllib3.util import Retry
 
 ###############################################################################
 # Constants
@@ -16,15 +24,53 @@ CLAUDE_URL = "https://platform.claude.com/docs/en/about-claude/model-deprecation
 AWS_URL = "https://docs.aws.amazon.com/bedrock/latest/userguide/model-lifecycle.html"
 AZURE_URL = "https://learn.microsoft.com/en-us/azure/ai-foundry/openai/concepts/model-retirements"
 
-OUTPUT_PATH = "output"
-OUTPUT_CSV = "model_retirements.csv"
+OUTPUT_DIR = Path("output")
+CSV_PATH = OUTPUT_DIR / "model_retirements.csv"
+CHANGES_CSV_PATH = OUTPUT_DIR / "model_retirements_changes.csv"
+RSS_PATH = OUTPUT_DIR / "rss.xml"
+HTTP_CACHE_PATH = OUTPUT_DIR / ".http_cache.json"
+CSV_FIELDNAMES = ("source", "model_name", "retirement_date", "recommended_replacement")
 
 GITHUB_PAGES_LINK = "https://nlinc1905.github.io/ai-model-retirements-rss/rss.xml"
+USER_AGENT = "ai-model-retirements-rss (+https://github.com/nlinc1905/ai-model-retirements-rss)"
+
+# ISO, Claude-style (February 19, 2026) and AWS-style (9/23/2025) dates,
+# matched in a single scan
+DATE_RE = re.compile(
+    r"(?a:\b(?P<iso>\d{4}-\d{2}-\d{2})\b)"
+    r"|(?P<claude_month>[A-Za-z]+)\s+(?P<claude_day>\d{1,2}),\s+(?P<claude_year>\d{4})"
+    r"|(?P<aws_month>\d{1,2})/(?P<aws_day>\d{1,2})/(?P<aws_year>\d{4})"
+)
+
+# Month names and abbreviations, lowercased, for Claude-style dates
+MONTHS = {
+    "january": 1, "february": 2, "march": 3, "april": 4,
+    "may": 5, "june": 6, "july": 7, "august": 8,
+    "september": 9, "october": 10, "november": 11, "december": 12,
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "jun": 6, "jul": 7,
+    "aug": 8, "sep": 9, "sept": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# Claude table header keywords and the fields they map to, in priority order
+CLAUDE_HEADER_RULES = (
+    ("retire", "retirement_date"),
+    ("model", "model_name"),
+    ("replacement", "recommended_replacement"),
+)
 
-DATE_SUFFIX_RE = re.compile(r"-\d{8}$")
-CLAUDE_DATE_RE = re.compile(r"([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})")
-AWS_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
-ISO_DATE_RE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
+###############################################################################
+# Rows
+###############################################################################
+
+@dataclass(slots=True)
+class Row:
+    """
+    A model retirement scraped from one source.
+    """
+    source: str
+    model_name: str
+    retirement_date: str
+    recommended_replacement: str
 
 ###############################################################################
 # Shared normalization utilities
@@ -33,14 +79,20 @@ ISO_DATE_RE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
 def normalize_model_name(name: Optional[str]) -> Optional[str]:
     if not name:
         return name
-    return DATE_SUFFIX_RE.sub("", name.strip())
+    name = name.strip()
+    # Drop a trailing -YYYYMMDD snapshot suffix
+    if len(name) >= 9 and name[-9] == "-" and name[-8:].isdecimal():
+        return name[:-9]
+    return name
 
 
+@lru_cache(maxsize=1024)
 def normalize_date_from_text(text: Optional[str]) -> Optional[str]:
     """
     Extract the earliest date from text and normalize to YYYY-MM-DD.
+    Results are memoized, since the same date cell text repeats across rows.
     Supports:
-      - February 19, 2026
+      - February 19, 2026 (or Feb 19, 2026)
       - Not sooner than February 19, 2026
       - 9/23/2025
       - ISO dates embedded in text
@@ -48,105 +100,178 @@ def normalize_date_from_text(text: Optional[str]) -> Optional[str]:
     if not text:
         return None
 
-    # ISO dates first
-    iso_matches = ISO_DATE_RE.findall(text)
-    dates = []
-
-    for m in iso_matches:
-        try:
-            dates.append(datetime.strptime(m, "%Y-%m-%d").date())
-        except ValueError:
-            pass
-
-    # Claude-style dates
-    match = CLAUDE_DATE_RE.search(text)
-    if match:
-        month, day, year = match.groups()
-        try:
-            dates.append(
-                datetime.strptime(f"{month} {day} {year}", "%B %d %Y").date()
+    candidates = set()
+
+    for match in DATE_RE.finditer(text):
+        if match["iso"]:
+            candidates.add(match["iso"])
+        elif match["claude_month"]:
+            month_number = MONTHS.get(match["claude_month"].lower())
+            if month_number:
+                candidates.add(
+                    f"{match['claude_year']}-{month_number:02d}-{match['claude_day'].zfill(2)}"
+                )
+        else:
+            candidates.add(
+                f"{match['aws_year']}-{match['aws_month'].zfill(2)}-{match['aws_day'].zfill(2)}"
             )
-        except ValueError:
-            pass
 
-    # AWS-style dates
-    match = AWS_DATE_RE.search(text)
-    if match:
-        month, day, year = match.groups()
+    # Canonical YYYY-MM-DD strings sort chronologically, so only validate
+    # candidates from the earliest until one is a real date
+    for candidate in sorted(candidates):
         try:
-            dates.append(datetime(int(year), int(month), int(day)).date())
+            date.fromisoformat(candidate)
         except ValueError:
-            pass
-
-    if not dates:
-        return None
+            continue
+        return candidate
 
-    return min(dates).strftime("%Y-%m-%d")
+    return None
 
 
-def deduplicate_rows(rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
+def deduplicate_rows(rows: List[Row]) -> List[Row]:
     """
     Deduplicate by model_name within a source.
     Keep earliest retirement_date.
     Prefer non-empty recommended_replacement.
+    Dates are canonical YYYY-MM-DD strings, so each row ranks by a single
+    (date, missing replacement) tuple compare.
     """
-    best: dict[str, Dict[str, str]] = {}
+    best: dict[str, Row] = {}
 
     for row in rows:
-        key = row["model_name"]
-        date = datetime.strptime(row["retirement_date"], "%Y-%m-%d").date()
+        existing = best.get(row.model_name)
 
-        if key not in best:
-            best[key] = row
-            continue
+        if existing is None or (
+            row.retirement_date, not row.recommended_replacement
+        ) < (
+            existing.retirement_date, not existing.recommended_replacement
+        ):
+            best[row.model_name] = row
 
-        existing = best[key]
-        existing_date = datetime.strptime(
-            existing["retirement_date"], "%Y-%m-%d"
-        ).date()
+    return list(best.values())
 
-        if date < existing_date:
-            best[key] = row
-        elif date == existing_date:
-            if row.get("recommended_replacement") and not existing.get("recommended_replacement"):
-                best[key] = row
+###############################################################################
+# HTTP
+###############################################################################
 
-    return list(best.values())
+def build_session() -> requests.Session:
+    """
+    Build a pooled HTTP session shared by all scrapers, retrying transient
+    connection failures and gateway errors with backoff.
+    """
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def load_http_cache(path: Path) -> Dict[str, dict]:
+    """
+    Load the HTTP cache keyed by source URL. Each entry holds the ETag and
+    Last-Modified validators and SHA-256 digest of the last full download,
+    and the rows parsed from it.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_http_cache(cache: Dict[str, dict], path: Path) -> None:
+    """
+    Write the HTTP cache, skipping the write when the contents are unchanged.
+    """
+    text = json.dumps(cache, indent=2, sort_keys=True)
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return
+    path.write_text(text, encoding="utf-8")
+
+
+def scrape_source(
+    session: requests.Session,
+    url: str,
+    parse: Callable[[bytes], List[Row]],
+    cache: Dict[str, dict],
+) -> List[Row]:
+    """
+    Fetch a source page with a conditional GET and parse it into rows.
+    If the server answers 304 Not Modified, or the downloaded body hashes the
+    same as last time, the rows cached from the previous run are returned
+    without parsing the page.
+    """
+    entry = cache.get(url)
+    headers = {}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+
+    resp = session.get(url, headers=headers, timeout=30)
+    if resp.status_code == 304 and entry:
+        return [Row(**row) for row in entry["rows"]]
+    resp.raise_for_status()
+
+    digest = hashlib.sha256(resp.content).hexdigest()
+    if entry and entry.get("sha256") == digest:
+        rows = [Row(**row) for row in entry["rows"]]
+    else:
+        rows = parse(resp.content)
+
+    cache[url] = {
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "sha256": digest,
+        "rows": [asdict(row) for row in rows],
+    }
+    return rows
 
 ###############################################################################
 # Scrapers
 ###############################################################################
 
-def scrape_claude() -> List[Dict[str, str]]:
-    resp = requests.get(CLAUDE_URL, timeout=30)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
+def element_text(element: etree._Element, separator: str = "") -> str:
+    """
+    Join the stripped, non-empty text nodes under an element, matching
+    BeautifulSoup's get_text(separator, strip=True).
+    """
+    return separator.join(filter(None, (s.strip() for s in element.itertext())))
+
+
+def parse_claude(content: bytes) -> List[Row]:
+    doc = lxml_html.document_fromstring(content)
 
     rows = []
 
-    for table in soup.find_all("table"):
-        headers = [th.get_text(strip=True).lower() for th in table.find_all("th")]
+    for table in doc.xpath("//table"):
+        headers = [element_text(th).lower() for th in table.xpath(".//th")]
         if not any("retire" in h for h in headers):
             continue
 
         header_map = {}
         for i, h in enumerate(headers):
-            if "retire" in h:
-                header_map["retirement_date"] = i
-            elif "model" in h:
-                header_map.setdefault("model_name", i)
-            elif "replacement" in h:
-                header_map["recommended_replacement"] = i
-
-        for tr in table.find_all("tr")[1:]:
-            tds = tr.find_all("td")
+            field = next((f for keyword, f in CLAUDE_HEADER_RULES if keyword in h), None)
+            if field == "model_name":
+                header_map.setdefault(field, i)
+            elif field:
+                header_map[field] = i
+
+        for tr in table.xpath(".//tr")[1:]:
+            tds = tr.xpath(".//td")
             if len(tds) < len(header_map):
                 continue
 
-            raw_date = tds[header_map["retirement_date"]].get_text(" ", strip=True)
-            raw_model = tds[header_map["model_name"]].get_text(" ", strip=True)
+            raw_date = element_text(tds[header_map["retirement_date"]], " ")
+            raw_model = element_text(tds[header_map["model_name"]], " ")
             raw_repl = (
-                tds[header_map["recommended_replacement"]].get_text(" ", strip=True)
+                element_text(tds[header_map["recommended_replacement"]], " ")
                 if "recommended_replacement" in header_map
                 else ""
             )
@@ -155,111 +280,125 @@ def scrape_claude() -> List[Dict[str, str]]:
             if not date:
                 continue
 
-            rows.append({
-                "source": CLAUDE_URL,
-                "model_name": normalize_model_name(raw_model),
-                "retirement_date": date,
-                "recommended_replacement": normalize_model_name(raw_repl),
-            })
+            rows.append(Row(
+                source=CLAUDE_URL,
+                model_name=normalize_model_name(raw_model),
+                retirement_date=date,
+                recommended_replacement=normalize_model_name(raw_repl),
+            ))
 
     return deduplicate_rows(rows)
 
 
-def scrape_aws() -> List[Dict[str, str]]:
-    resp = requests.get(AWS_URL, timeout=30)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
-
-    header = soup.find(lambda t: t.name == "h2" and "Active versions" in t.text)
-    if not header:
-        return []
-
-    table = header.find_next("table")
-    headers = [th.get_text(strip=True).lower() for th in table.find_all("th")]
+def parse_aws_table(table: etree._Element) -> List[Row]:
+    """
+    Extract rows from the AWS "Active versions" table.
+    """
+    headers = [element_text(th).lower() for th in table.xpath(".//th")]
 
     model_idx = headers.index("model name")
     date_idx = headers.index("eol date")
 
     rows = []
 
-    for tr in table.find_all("tr")[1:]:
-        tds = tr.find_all("td")
-        raw_date = tds[date_idx].get_text(" ", strip=True)
+    for tr in table.xpath(".//tr")[1:]:
+        tds = tr.xpath(".//td")
+        raw_date = element_text(tds[date_idx], " ")
         date = normalize_date_from_text(raw_date)
         if not date:
             continue
 
-        rows.append({
-            "source": AWS_URL,
-            "model_name": normalize_model_name(tds[model_idx].get_text(strip=True)),
-            "retirement_date": date,
-            "recommended_replacement": "",
-        })
+        rows.append(Row(
+            source=AWS_URL,
+            model_name=normalize_model_name(element_text(tds[model_idx])),
+            retirement_date=date,
+            recommended_replacement="",
+        ))
 
-    return deduplicate_rows(rows)
+    return rows
 
 
-def scrape_azure() -> List[Dict[str, str]]:
-    resp = requests.get(AZURE_URL, timeout=30)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, "html.parser")
+def parse_aws(content: bytes) -> List[Row]:
+    found_header = False
 
-    # Find the start and end headers
-    start_h2 = soup.find("h2", string=lambda s: s and "current models" in s.lower())
-    end_h2 = soup.find("h2", string=lambda s: s and "fine-tuned models" in s.lower())
+    # Stream the page and stop at the first table after the "Active versions"
+    # h2, rather than building a tree of the whole document
+    events = etree.iterparse(
+        io.BytesIO(content), events=("end",), tag=("h2", "table"), html=True
+    )
+    for _, elem in events:
+        if elem.tag == "h2":
+            found_header = found_header or "Active versions" in "".join(elem.itertext())
+        elif found_header:
+            return deduplicate_rows(parse_aws_table(elem))
 
-    if not start_h2 or not end_h2:
-        raise RuntimeError("Could not locate expected h2 boundaries")
+    return []
 
-    # Collect everything between the two h2 headers
-    section_nodes = []
-    node = start_h2.next_sibling
-    while node and node != end_h2:
-        if getattr(node, "name", None):
-            section_nodes.append(node)
-        node = node.next_sibling
-
-    # Wrap extracted content in a new soup fragment for downstream parsing
-    current_models_soup = BeautifulSoup(
-        "".join(str(n) for n in section_nodes),
-        "html.parser",
-    )
+
+def parse_azure_table(table: etree._Element) -> List[Row]:
+    """
+    Extract rows from one Azure model table, or none if the table does not
+    list model names with retirement dates.
+    """
+    headers = [element_text(th).lower() for th in table.xpath(".//th")]
+
+    if "model name" not in headers or "retirement date" not in headers:
+        return []
+
+    model_idx = headers.index("model name")
+    date_idx = headers.index("retirement date")
+    repl_idx = headers.index("replacement model") if "replacement model" in headers else None
 
     rows = []
 
-    # Iterate ALL tables in all tabs (Text, Audio, Image/Video, Embeddings)
-    for table in current_models_soup.find_all("table"):
-        headers = [th.get_text(strip=True).lower() for th in table.find_all("th")]
+    for tr in table.xpath(".//tr")[1:]:
+        tds = tr.xpath(".//td")
+        if len(tds) < max(model_idx, date_idx) + 1:
+            continue
 
-        if "model name" not in headers or "retirement date" not in headers:
+        raw_date = element_text(tds[date_idx], " ")
+        date = normalize_date_from_text(raw_date)
+        if not date:
             continue
 
-        model_idx = headers.index("model name")
-        date_idx = headers.index("retirement date")
-        repl_idx = headers.index("replacement model") if "replacement model" in headers else None
+        rows.append(Row(
+            source=AZURE_URL,
+            model_name=normalize_model_name(element_text(tds[model_idx])),
+            retirement_date=date,
+            recommended_replacement=(
+                normalize_model_name(element_text(tds[repl_idx]))
+                if repl_idx is not None and repl_idx < len(tds)
+                else ""
+            ),
+        ))
+
+    return rows
 
-        for tr in table.find_all("tr")[1:]:
-            tds = tr.find_all("td")
-            if len(tds) < max(model_idx, date_idx) + 1:
-                continue
 
-            raw_date = tds[date_idx].get_text(" ", strip=True)
-            date = normalize_date_from_text(raw_date)
-            if not date:
-                continue
+def parse_azure(content: bytes) -> List[Row]:
+    rows = []
+    found_start = found_end = False
 
-            rows.append({
-                "source": AZURE_URL,
-                "model_name": normalize_model_name(
-                    tds[model_idx].get_text(strip=True)
-                ),
-                "retirement_date": date,
-                "recommended_replacement": (
-                    normalize_model_name(tds[repl_idx].get_text(strip=True))
-                    if repl_idx is not None and repl_idx < len(tds)
-                    else ""
-                ),
-            })
+    # Stream the page in a single pass, keeping ALL tables in all tabs (Text,
+    # Audio, Image/Video, Embeddings) that close between the "Current models"
+    # and "Fine-tuned models" h2 headers, and stop parsing at the latter
+    events = etree.iterparse(
+        io.BytesIO(content), events=("end",), tag=("h2", "table"), html=True
+    )
+    for _, elem in events:
+        if elem.tag == "h2":
+            heading = element_text(elem, " ").lower()
+            if not found_start and "current models" in heading:
+                found_start = True
+            elif found_start and "fine-tuned models" in heading:
+                found_end = True
+                break
+        elif found_start:
+            rows.extend(parse_azure_table(elem))
+            elem.clear()
+
+    if not found_start or not found_end:
+        raise RuntimeError("Could not locate expected h2 boundaries")
 
     return deduplicate_rows(rows)
 
@@ -267,137 +406,138 @@ def scrape_azure() -> List[Dict[str, str]]:
 # RSS functions
 ###############################################################################
 
-def write_rss(rows: List[Dict[str, str]], path: str) -> None:
+def write_rss(rows: List[Row], path: Path) -> None:
     """
     Write model retirement changes to an RSS 2.0 feed.
     """
-    rss = ET.Element("rss", version="2.0")
-    channel = ET.SubElement(rss, "channel")
+    rss = etree.Element("rss", version="2.0")
+    channel = etree.SubElement(rss, "channel")
 
-    ET.SubElement(channel, "title").text = "AI Model Retirement Updates"
-    ET.SubElement(channel, "link").text = GITHUB_PAGES_LINK
-    ET.SubElement(channel, "description").text = (
+    etree.SubElement(channel, "title").text = "AI Model Retirement Updates"
+    etree.SubElement(channel, "link").text = GITHUB_PAGES_LINK
+    etree.SubElement(channel, "description").text = (
         "Updates to retirement dates and replacements for AI foundation models "
         "from Claude, AWS Bedrock, and Azure OpenAI."
     )
 
-    now = datetime.now(timezone.utc)
-    ET.SubElement(channel, "lastBuildDate").text = format_datetime(now)
+    # Every item in a build shares one timestamp, so format it once
+    now = format_datetime(datetime.now(timezone.utc))
+    etree.SubElement(channel, "lastBuildDate").text = now
 
     for row in rows:
-        item = ET.SubElement(channel, "item")
+        item = etree.SubElement(channel, "item")
 
-        title = f"{row['model_name']} retirement update"
-        ET.SubElement(item, "title").text = title
+        title = f"{row.model_name} retirement update"
+        etree.SubElement(item, "title").text = title
 
         description = (
-            f"Source: {row['source']}|"
-            f"Model: {row['model_name']}|"
-            f"Retirement date: {row['retirement_date']}"
+            f"Source: {row.source}|"
+            f"Model: {row.model_name}|"
+            f"Retirement date: {row.retirement_date}"
         )
 
-        if row.get("recommended_replacement"):
+        if row.recommended_replacement:
             description += (
-                f"|Recommended replacement: {row['recommended_replacement']}"
+                f"|Recommended replacement: {row.recommended_replacement}"
             )
 
-        ET.SubElement(item, "description").text = description
-        ET.SubElement(item, "guid").text = (
-            f"{row['source']}|{row['model_name']}|{row['retirement_date']}"
+        etree.SubElement(item, "description").text = description
+        # Stable across runs so readers dedupe unchanged entries; not a URL
+        etree.SubElement(item, "guid", isPermaLink="false").text = (
+            f"{row.source}|{row.model_name}|{row.retirement_date}"
         )
-        ET.SubElement(item, "pubDate").text = format_datetime(now)
+        etree.SubElement(item, "pubDate").text = now
 
-    tree = ET.ElementTree(rss)
-    tree.write(path, encoding="utf-8", xml_declaration=True)
+    # Serialize in memory and flush with a single write
+    path.write_bytes(
+        etree.tostring(rss, encoding="utf-8", xml_declaration=True, pretty_print=True)
+    )
 
 ###############################################################################
 # Main
 ###############################################################################
 
-def load_existing_csv(path: str) -> Dict[tuple, Dict[str, str]]:
+def load_existing_csv(path: Path) -> Dict[Tuple[str, str], Tuple[str, str]]:
     """
-    Load existing CSV into a dict keyed by (source, model_name).
+    Load existing CSV into a dict mapping (source, model_name) to
+    (retirement_date, recommended_replacement).
     """
-    existing = {}
     with open(path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            key = (row["source"], row["model_name"])
-            existing[key] = row
-    return existing
+        reader = csv.reader(f)
+        next(reader, None)  # header
+        return {
+            (source, model_name): (retirement_date, recommended_replacement)
+            for source, model_name, retirement_date, recommended_replacement in reader
+        }
 
 
 def diff_rows(
-    new_rows: List[Dict[str, str]],
-    existing_rows: Dict[tuple, Dict[str, str]],
-) -> List[Dict[str, str]]:
+    new_rows: List[Row],
+    existing_rows: Dict[Tuple[str, str], Tuple[str, str]],
+) -> List[Row]:
     """
     Return rows that are new or have changed fields.
     """
-    changes = []
-
-    for row in new_rows:
-        key = (row["source"], row["model_name"])
-
-        if key not in existing_rows:
-            changes.append(row)
-            continue
-
-        existing = existing_rows[key]
-
-        if (
-            row["retirement_date"] != existing["retirement_date"]
-            or row.get("recommended_replacement", "")
-            != existing.get("recommended_replacement", "")
-        ):
-            changes.append(row)
-
-    return changes
-
-
-def write_csv(rows: List[Dict[str, str]], path: str) -> None:
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=[
-                "source",
-                "model_name",
-                "retirement_date",
-                "recommended_replacement",
-            ],
-        )
-        writer.writeheader()
-        writer.writerows(rows)
+    return [
+        row
+        for row in new_rows
+        if existing_rows.get((row.source, row.model_name))
+        != (row.retirement_date, row.recommended_replacement)
+    ]
+
+
+def write_csv(rows: List[Row], path: Path) -> None:
+    # Build the CSV in memory and flush with a single write
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(CSV_FIELDNAMES)
+    writer.writerows(
+        (row.source, row.model_name, row.retirement_date, row.recommended_replacement)
+        for row in rows
+    )
+    path.write_text(buf.getvalue(), encoding="utf-8", newline="")
 
 
 if __name__ == "__main__":
-    all_rows = []
-    all_rows.extend(scrape_claude())
-    all_rows.extend(scrape_aws())
-    all_rows.extend(scrape_azure())
+    sources = (
+        (CLAUDE_URL, parse_claude),
+        (AWS_URL, parse_aws),
+        (AZURE_URL, parse_azure),
+    )
+    http_cache = load_http_cache(HTTP_CACHE_PATH)
+
+    # Fetch all sources concurrently over one pooled session; the run is
+    # dominated by network wait, so this takes max-of-three instead of sum
+    with build_session() as session, ThreadPoolExecutor(len(sources)) as pool:
+        futures = [
+            pool.submit(scrape_source, session, url, parse, http_cache)
+            for url, parse in sources
+        ]
+        all_rows = []
+        for future in futures:
+            all_rows.extend(future.result())
 
     if not all_rows:
         raise RuntimeError("No data scraped — page structures may have changed.")
 
-    output_path = Path(OUTPUT_PATH + "/" + OUTPUT_CSV)
+    save_http_cache(http_cache, HTTP_CACHE_PATH)
 
     # First run: no existing file
-    if not output_path.exists():
-        write_csv(all_rows, OUTPUT_PATH + "/" + OUTPUT_CSV)
-        write_rss(all_rows, OUTPUT_PATH + "/" + "rss.xml")
-        print(f"Wrote {len(all_rows)} rows to {OUTPUT_PATH + "/" + OUTPUT_CSV} and initial rss.xml")
+    if not CSV_PATH.exists():
+        write_csv(all_rows, CSV_PATH)
+        write_rss(all_rows, RSS_PATH)
+        print(f"Wrote {len(all_rows)} rows to {CSV_PATH} and initial rss.xml")
         raise SystemExit(0)
 
     # Subsequent runs: diff against existing data
-    existing = load_existing_csv(OUTPUT_PATH + "/" + OUTPUT_CSV)
+    existing = load_existing_csv(CSV_PATH)
     changes = diff_rows(all_rows, existing)
 
     if not changes:
         print("No changes detected.")
         raise SystemExit(0)
 
-    changes_csv = OUTPUT_PATH + "/" + "model_retirements_changes.csv"
-    write_csv(changes, changes_csv)
-    write_rss(all_rows, OUTPUT_PATH + "/" + "rss.xml")
+    write_csv(changes, CHANGES_CSV_PATH)
+    write_rss(all_rows, RSS_PATH)
 
-    print(f"Wrote {len(changes)} changed rows to {changes_csv} and updated rss.xml")
+    print(f"Wrote {len(changes)} changed rows to {CHANGES_CSV_PATH} and updated rss.xml")